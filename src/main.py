@@ -3,6 +3,7 @@ import sys
 import os
 import json
 import random
+from functools import lru_cache
 
 # Config
 ASSET_DIR = os.path.join(os.path.dirname(__file__), '..', 'assets')
@@ -28,119 +29,210 @@ SCENE_QUIZ = 'quiz'
 SCENE_CREDITS = 'credits'
 SCENE_SETTINGS = 'settings'
 
+# Sound effects decoded once at startup
+SFX_FILES = {'click': 'click.wav', 'score': 'score.wav'}
+
+# Event types the scenes consume; SDL drops everything else before it reaches Python
+EVENT_TYPES = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.VIDEOEXPOSE]
+
 # Time limits per difficulty
 TIME_LIMITS = {'Easy': 20, 'Medium': 15, 'Hard': 10}
 
+# Fonts are built lazily (pygame.font must be initialised first) and reused
+_FONT_CACHE = {}
+
+def get_font(size):
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = _FONT_CACHE[size] = pygame.font.Font(None, size)
+    return font
+
+@lru_cache(maxsize=512)
+def render_text(size, text, color):
+    return get_font(size).render(text, True, color).convert_alpha()
+
+# Decoded images keyed by (path, alpha), shared across scene instances
+_IMG_CACHE = {}
+
+def load_image(path, alpha=False):
+    key = (path, alpha)
+    img = _IMG_CACHE.get(key)
+    if img is None:
+        img = pygame.image.load(path)
+        img = img.convert_alpha() if alpha else img.convert()
+        _IMG_CACHE[key] = img
+    return img
+
+def blit_all(surf, seq):
+    # pygame-ce batches blits through fblits; plain pygame has to loop
+    if hasattr(surf, 'fblits'):
+        surf.fblits(seq)
+    else:
+        for img, dest in seq:
+            surf.blit(img, dest)
+
+# Parsed question files keyed by school prefix, bucketed by difficulty
+_QUESTIONS = {}
+
+def load_questions(prefix):
+    buckets = _QUESTIONS.get(prefix)
+    if buckets is None:
+        file_path = os.path.join(DATA_DIR, f"{prefix}_question.json")
+        data = []
+        if os.path.exists(file_path):
+            with open(file_path) as f:
+                data = json.load(f)
+        buckets = {}
+        for q in data:
+            buckets.setdefault(q.get('difficulty'), []).append(q)
+        _QUESTIONS[prefix] = buckets
+    return buckets
+
+# Track the track currently streaming, so revisiting a scene doesn't restart it
+_current_music = None
+
+def play_music(fname):
+    global _current_music
+    if _current_music == fname and pygame.mixer.music.get_busy():
+        return
+    path = os.path.join(AUDIO_DIR, fname)
+    if os.path.exists(path):
+        pygame.mixer.music.load(path)
+        pygame.mixer.music.set_volume(0.5)
+        pygame.mixer.music.play(-1)
+        _current_music = fname
+
 class Button:
-    def __init__(self, rect, text, callback):
+    def __init__(self, rect, text, callback, rendered=None):
         self.rect = pygame.Rect(rect)
-        self.text = text
         self.callback = callback
-        self.font = pygame.font.Font(None, 28)
+        self.font = get_font(28)
+        self._surface = pygame.Surface(self.rect.size).convert()
+        self.set_text(text, rendered)
+
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        self.set_text(value)
+
+    def set_text(self, text, rendered=None):
+        # Bake background and label into one surface; callers holding an
+        # already rendered label can hand it over directly
+        self._text = text
+        if rendered is None:
+            rendered = self.font.render(text, True, (255, 255, 255))
+        self._surface.fill((50, 50, 50))
+        self._surface.blit(rendered, rendered.get_rect(center=self._surface.get_rect().center))
 
     def draw(self, surf):
-        pygame.draw.rect(surf, (50, 50, 50), self.rect)
-        txt = self.font.render(self.text, True, (255, 255, 255))
-        surf.blit(txt, txt.get_rect(center=self.rect.center))
+        surf.blit(self._surface, self.rect)
 
     def handle_event(self, evt):
-        if evt.type == pygame.MOUSEBUTTONDOWN and self.rect.collidepoint(evt.pos):
+        # Only called with MOUSEBUTTONDOWN events; scenes filter the rest
+        if self.rect.collidepoint(evt.pos):
             self.callback()
+            return True
+        return False
 
 class SceneBase:
     def __init__(self, game):
         self.game = game
-        self.bottom_buttons = []
-        btn_w = SCREEN_WIDTH // len(BOTTOM_BUTTONS)
-        btn_h = 40
-        for i, label in enumerate(BOTTOM_BUTTONS):
-            rect = (i * btn_w, SCREEN_HEIGHT - btn_h, btn_w, btn_h)
-            self.bottom_buttons.append(Button(rect, label, lambda l=label: game.on_bottom(l)))
+
+    def on_enter(self):
+        # Called each time the scene becomes active, including reuse of a cached instance
+        pass
 
     def draw_bottom(self, surf):
-        for b in self.bottom_buttons:
+        for b in self.game.bottom_buttons:
             b.draw(surf)
 
     def handle_event(self, evt):
-        if evt.type == pygame.MOUSEBUTTONDOWN and self.game.click_sfx:
+        if evt.type != pygame.MOUSEBUTTONDOWN:
+            return
+        if self.game.click_sfx:
             self.game.click_sfx.play()
-        for b in self.bottom_buttons:
-            b.handle_event(evt)
+        for b in self.game.bottom_buttons:
+            if b.handle_event(evt):
+                return
 
 class SplashScene(SceneBase):
     def __init__(self, game):
         super().__init__(game)
         self.start = pygame.time.get_ticks()
-        self.img = pygame.image.load(os.path.join(IMG_DIR, 'splash.png')).convert()
-        self._play_music('menu_bgm.ogg')
-
-    def _play_music(self, fname):
-        path = os.path.join(AUDIO_DIR, fname)
-        if os.path.exists(path):
-            pygame.mixer.music.load(path)
-            pygame.mixer.music.set_volume(0.5)
-            pygame.mixer.music.play(-1)
+        self.img = load_image(os.path.join(IMG_DIR, 'splash.png'))
+        play_music('menu_bgm.ogg')
 
-    def update(self):
-        if pygame.time.get_ticks() - self.start > 3000:
+    def update(self, now):
+        if now - self.start > 3000:
             self.game.change_scene(SCENE_MENU)
 
-    def draw(self, surf):
+    def draw(self, surf, now=None):
         surf.blit(self.img, (0, 0))
+        return []
 
 class MenuScene(SceneBase):
     def __init__(self, game):
         super().__init__(game)
-        self._play_music('menu_bgm.ogg')
-        self.icons = []  # list of (image, label, key)
+        play_music('menu_bgm.ogg')
+        icons = []  # list of (image, label, key)
         skip = {
             "settings",
             "general_knowledge",
             "credits_bg",
             "learn_futa's_history",
         }
-        for fname in sorted(os.listdir(ICONS_DIR)):
-            if fname.lower().endswith('.png'):
-                key = os.path.splitext(fname)[0].lower()
-                if key in skip:
-                    continue
-                img = pygame.image.load(os.path.join(ICONS_DIR, fname)).convert_alpha()
-                label = key.replace('_', ' ').title()
-                self.icons.append((img, label, key))
-
-    def _play_music(self, fname):
-        path = os.path.join(AUDIO_DIR, fname)
-        if os.path.exists(path) and not pygame.mixer.music.get_busy():
-            pygame.mixer.music.load(path)
-            pygame.mixer.music.set_volume(0.5)
-            pygame.mixer.music.play(-1)
-
-    def draw(self, surf):
-        surf.fill((0, 0, 0))
+        with os.scandir(ICONS_DIR) as it:
+            entries = sorted(
+                (e for e in it if e.is_file() and e.name.lower().endswith('.png')),
+                key=lambda e: e.name
+            )
+        for entry in entries:
+            key = os.path.splitext(entry.name)[0].lower()
+            if key in skip:
+                continue
+            img = load_image(entry.path, alpha=True)
+            label = key.replace('_', ' ').title()
+            icons.append((img, label, key))
+        # Grid layout is fixed, so scale icons and render labels only once
         cols = 4
-        rows = max(1, (len(self.icons) + cols - 1) // cols)
+        rows = max(1, (len(icons) + cols - 1) // cols)
         cell_w = SCREEN_WIDTH / cols
         cell_h = (SCREEN_HEIGHT - 40) / rows
-        self.icon_rects = []
-        for idx, (img, label, key) in enumerate(self.icons):
+        self._cols, self._cell_w, self._cell_h = cols, cell_w, cell_h
+        self.icons = []  # list of (scaled image, label, key, rect)
+        self.labels = []  # list of (text surface, rect)
+        for idx, (img, label, key) in enumerate(icons):
             r, c = divmod(idx, cols)
             scale = (min(cell_w, cell_h) * 0.5) / max(img.get_width(), img.get_height())
             img_s = pygame.transform.smoothscale(
                 img,
                 (int(img.get_width() * scale), int(img.get_height() * scale))
-            )
+            ).convert_alpha()
             x = c * cell_w + (cell_w - img_s.get_width()) / 2
             y = r * cell_h + cell_h * 0.1
             rect = img_s.get_rect(topleft=(x, y))
-            surf.blit(img_s, rect)
-            txt = pygame.font.Font(None, 20).render(label, True, (255, 255, 255))
-            surf.blit(txt, txt.get_rect(midtop=(rect.centerx, rect.bottom + 5)))
-            self.icon_rects.append((rect, label, key))
+            txt = render_text(20, label, (255, 255, 255))
+            self.icons.append((img_s, label, key, rect))
+            self.labels.append((txt, txt.get_rect(midtop=(rect.centerx, rect.bottom + 5))))
+        self.blit_seq = [(img, rect) for img, _label, _key, rect in self.icons] + self.labels
+
+    def draw(self, surf, now=None):
+        surf.fill((0, 0, 0))
+        blit_all(surf, self.blit_seq)
         self.draw_bottom(surf)
+        return []
 
     def handle_event(self, evt):
         if evt.type == pygame.MOUSEBUTTONDOWN:
-            for rect, label, key in self.icon_rects:
+            # Icons sit inside their grid cells, so the cell under the cursor is the only candidate
+            c = int(evt.pos[0] // self._cell_w)
+            r = int(evt.pos[1] // self._cell_h)
+            idx = r * self._cols + c
+            if c < self._cols and 0 <= idx < len(self.icons):
+                _img, label, key, rect = self.icons[idx]
                 if rect.collidepoint(evt.pos):
                     if label == 'Cancel':
                         pygame.quit()
@@ -161,11 +253,10 @@ class CategoryScene(SceneBase):
         if not os.path.exists(path):
             path = os.path.join(IMG_DIR, f"{game.selected_key}.png")
         if os.path.exists(path):
-            self.bg = pygame.image.load(path).convert()
+            self.bg = load_image(path)
         else:
-            self.bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
             self.bg.fill((0, 0, 128))
-        self._play_music('calm_bgm.ogg')
         self.buttons = []
         w, h, g = 200, 60, 20
         for i, diff in enumerate(['Easy', 'Medium', 'Hard']):
@@ -173,24 +264,22 @@ class CategoryScene(SceneBase):
             y = SCREEN_HEIGHT/2
             self.buttons.append(Button((x, y, w, h), diff, lambda d=diff: game.start_quiz(d)))
 
-    def _play_music(self, fname):
-        path = os.path.join(AUDIO_DIR, fname)
-        if os.path.exists(path):
-            pygame.mixer.music.load(path)
-            pygame.mixer.music.set_volume(0.5)
-            pygame.mixer.music.play(-1)
+    def on_enter(self):
+        play_music('calm_bgm.ogg')
 
-    def draw(self, surf):
+    def draw(self, surf, now=None):
         surf.blit(self.bg, (0, 0))
         title = f"{self.game.selected_school} - Select Difficulty"
-        surf.blit(pygame.font.Font(None, 48).render(title, True, (255, 255, 255)), (100, 100))
+        surf.blit(render_text(48, title, (255, 255, 255)), (100, 100))
         for b in self.buttons:
             b.draw(surf)
         self.draw_bottom(surf)
 
     def handle_event(self, evt):
-        for b in self.buttons:
-            b.handle_event(evt)
+        if evt.type == pygame.MOUSEBUTTONDOWN:
+            for b in self.buttons:
+                if b.handle_event(evt):
+                    break
         super().handle_event(evt)
 
 class InputScene(SceneBase):
@@ -200,7 +289,7 @@ class InputScene(SceneBase):
         self.text = ''
         self.font = pygame.font.Font(None, 36)
 
-    def draw(self, surf):
+    def draw(self, surf, now=None):
         surf.fill((30, 30, 30))
         surf.blit(self.font.render('Enter your name:', True, (255, 255, 255)), (100, 200))
         surf.blit(self.font.render(self.text, True, (255, 255, 255)), (100, 250))
@@ -226,22 +315,29 @@ class QuizScene(SceneBase):
         if not os.path.exists(path):
             path = os.path.join(IMG_DIR, f"{prefix}.png")
         if os.path.exists(path):
-            self.bg = pygame.image.load(path).convert()
+            self.bg = load_image(path)
         else:
-            self.bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
             self.bg.fill((0, 0, 128))
-        self._play_music('game.mp3')
-        score_path = os.path.join(AUDIO_DIR, 'score.wav')
-        self.score_sfx = pygame.mixer.Sound(score_path) if os.path.exists(score_path) else None
-        q_file = f"{prefix}_question.json"
-        file_path = os.path.join(DATA_DIR, q_file)
-        data = []
-        if os.path.exists(file_path):
-            with open(file_path) as f:
-                data = json.load(f)
-        self.qs = [q for q in data if q.get('difficulty') == game.selected_difficulty]
-        random.shuffle(self.qs)
-        self.qs = self.qs[:10]
+        play_music('game.mp3')
+        pool = load_questions(prefix).get(game.selected_difficulty, [])
+        self.qs = random.sample(pool, k=min(10, len(pool)))
+        # (question surface, option surfaces, answer index) per question
+        self.prepared = [
+            (render_text(36, q['question'], (255, 255, 255)),
+             [render_text(28, o, (255, 255, 255)) for o in q['options']],
+             q['answerIndex'])
+            for q in self.qs
+        ]
+        self.bar_w, self.bar_h = int(SCREEN_WIDTH * 0.8), 20
+        self.bar_x, self.bar_y = (SCREEN_WIDTH - self.bar_w) // 2, 150
+        self._bar_bg = pygame.Surface((self.bar_w, self.bar_h)).convert()
+        self._bar_bg.fill((100, 100, 100))
+        self._bar_fg = pygame.Surface((self.bar_w, self.bar_h)).convert()
+        self._bar_fg.fill((50, 200, 50))
+        self._overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self._overlay.fill((0, 0, 0, 180))
+        self.end_blits = []
         self.idx = 0
         self.score = 0
         self.limit = TIME_LIMITS.get(game.selected_difficulty, 10)
@@ -251,29 +347,21 @@ class QuizScene(SceneBase):
         self.finished = False
         self.opts = []
         if self.qs:
-            for i, opt in enumerate(self.qs[0]['options']):
+            for i, (opt, rendered) in enumerate(zip(self.qs[0]['options'], self.prepared[0][1])):
                 rect = (100, 200 + i*80, SCREEN_WIDTH - 200, 60)
-                self.opts.append(Button(rect, opt, lambda idx=i: self.select(idx)))
-
-    def _play_music(self, fname):
-        path = os.path.join(AUDIO_DIR, fname)
-        if os.path.exists(path):
-            pygame.mixer.music.load(path)
-            pygame.mixer.music.set_volume(0.5)
-            pygame.mixer.music.play(-1)
+                self.opts.append(Button(rect, opt, lambda idx=i: self.select(idx), rendered))
 
     def select(self, idx):
         if self.feedback or self.finished:
             return
-        correct = self.qs[self.idx]['answerIndex']
+        correct = self.prepared[self.idx][2]
         self.feedback = True
         self.sel = idx
         if idx == correct:
             self.score += 1
         self.feed_time = pygame.time.get_ticks()
 
-    def update(self):
-        now = pygame.time.get_ticks()
+    def update(self, now):
         if not self.feedback and not self.finished:
             elapsed = (now - self.start) / 1000
             if elapsed >= self.limit:
@@ -282,121 +370,157 @@ class QuizScene(SceneBase):
             self.idx += 1
             if self.idx >= len(self.qs):
                 self.finished = True
-                if self.score_sfx:
-                    self.score_sfx.play()
+                score_txt = render_text(64, f"Final Score: {self.score}/{len(self.qs)}", (255, 255, 0))
+                prompt = render_text(48, "Click to return to menu", (255, 255, 255))
+                self.end_blits = [
+                    (self._overlay, (0, 0)),
+                    (score_txt, score_txt.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2 - 50))),
+                    (prompt, prompt.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2 + 50))),
+                ]
+                score_sfx = self.game.sfx.get('score')
+                if score_sfx:
+                    score_sfx.play()
                 return
             self.start = now
             self.feedback = False
             self.sel = None
-            for btn, opt in zip(self.opts, self.qs[self.idx]['options']):
-                btn.text = opt
+            options = self.qs[self.idx]['options']
+            for btn, opt, rendered in zip(self.opts, options, self.prepared[self.idx][1]):
+                btn.set_text(opt, rendered)
 
-    def draw(self, surf):
+    def draw(self, surf, now=None):
+        if now is None:
+            now = pygame.time.get_ticks()
         surf.blit(self.bg, (0, 0))
         if self.finished:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            surf.blit(overlay, (0, 0))
-            score_txt = pygame.font.Font(None, 64).render(f"Final Score: {self.score}/{len(self.qs)}", True, (255, 255, 0))
-            surf.blit(score_txt, score_txt.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2 - 50)))
-            prompt = pygame.font.Font(None, 48).render("Click to return to menu", True, (255, 255, 255))
-            surf.blit(prompt, prompt.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2 + 50)))
+            blit_all(surf, self.end_blits)
         else:
             if self.qs and self.idx < len(self.qs):
-                qtxt = pygame.font.Font(None, 36).render(self.qs[self.idx]['question'], True, (255, 255, 255))
-                surf.blit(qtxt, (100, 100))
-                pct = max(0, (self.limit - ((pygame.time.get_ticks() - self.start) / 1000)) / self.limit)
-                bar_w, bar_h = SCREEN_WIDTH * 0.8, 20
-                bar_x, bar_y = (SCREEN_WIDTH - bar_w) / 2, 150
-                pygame.draw.rect(surf, (100, 100, 100), (bar_x, bar_y, bar_w, bar_h))
-                pygame.draw.rect(surf, (50, 200, 50), (bar_x, bar_y, bar_w * pct, bar_h))
+                surf.blit(self.prepared[self.idx][0], (100, 100))
+                pct = max(0, (self.limit - ((now - self.start) / 1000)) / self.limit)
+                surf.blit(self._bar_bg, (self.bar_x, self.bar_y))
+                surf.blit(self._bar_fg, (self.bar_x, self.bar_y), (0, 0, int(self.bar_w * pct), self.bar_h))
                 for b in self.opts:
                     b.draw(surf)
                 if self.feedback:
-                    corr = self.qs[self.idx]['answerIndex']
+                    corr = self.prepared[self.idx][2]
+                    # Hold one lock across the border draws (blits refuse a locked surface)
+                    surf.lock()
                     for i, b in enumerate(self.opts):
                         if i == corr:
                             pygame.draw.rect(surf, (50, 200, 50), b.rect, 4)
                         elif i == self.sel:
                             pygame.draw.rect(surf, (200, 50, 50), b.rect, 4)
+                    surf.unlock()
             else:
-                msg = pygame.font.Font(None, 48).render('No Questions Available', True, (255, 0, 0))
+                msg = render_text(48, 'No Questions Available', (255, 0, 0))
                 surf.blit(msg, (100, 100))
         self.draw_bottom(surf)
 
     def handle_event(self, evt):
-        if self.finished and evt.type == pygame.MOUSEBUTTONDOWN:
-            self.game.change_scene(SCENE_MENU)
-            return
-        for b in self.opts:
-            b.handle_event(evt)
+        if evt.type == pygame.MOUSEBUTTONDOWN:
+            if self.finished:
+                self.game.change_scene(SCENE_MENU)
+                return
+            for b in self.opts:
+                if b.handle_event(evt):
+                    break
         super().handle_event(evt)
 
 class CreditsScene(SceneBase):
     def __init__(self, game):
         super().__init__(game)
-        self.bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
         self.bg.fill((20, 20, 60))
         self.lines = [
             "FUTA Virtual Game",
             "Developed by FUTA Team",
             "Thank you for playing!",
         ]
+        self.blit_seq = []
+        for i, line in enumerate(self.lines):
+            txt = render_text(48, line, (255, 255, 255))
+            self.blit_seq.append((txt, txt.get_rect(center=(SCREEN_WIDTH/2, 200 + i*60))))
 
-    def draw(self, surf):
+    def draw(self, surf, now=None):
         surf.blit(self.bg, (0, 0))
-        for i, line in enumerate(self.lines):
-            txt = pygame.font.Font(None, 48).render(line, True, (255, 255, 255))
-            rect = txt.get_rect(center=(SCREEN_WIDTH/2, 200 + i*60))
-            surf.blit(txt, rect)
+        blit_all(surf, self.blit_seq)
         self.draw_bottom(surf)
+        return []
 
 class SettingsScene(SceneBase):
     def __init__(self, game):
         super().__init__(game)
-        self.bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
         self.bg.fill((60, 20, 20))
         self.volume = pygame.mixer.music.get_volume()
         self.font = pygame.font.Font(None, 36)
+        self.bar_rect = pygame.Rect(100, 250, 400, 20)
+        self.volume_changed = False
 
-    def draw(self, surf):
+    def on_enter(self):
+        # Loading a new track resets the volume, so re-read it on every visit
+        self.volume = pygame.mixer.music.get_volume()
+
+    def draw(self, surf, now=None):
         surf.blit(self.bg, (0, 0))
         txt = self.font.render("Music Volume", True, (255, 255, 255))
         surf.blit(txt, (100, 200))
-        bar_width = 400
-        bar_rect = pygame.Rect(100, 250, bar_width, 20)
-        pygame.draw.rect(surf, (100, 100, 100), bar_rect)
-        fill_rect = bar_rect.copy()
-        fill_rect.width = int(bar_width * self.volume)
+        fill_rect = self.bar_rect.copy()
+        fill_rect.width = int(self.bar_rect.width * self.volume)
+        surf.lock()
+        pygame.draw.rect(surf, (100, 100, 100), self.bar_rect)
         pygame.draw.rect(surf, (200, 200, 0), fill_rect)
+        surf.unlock()
         self.draw_bottom(surf)
+        if self.volume_changed:
+            self.volume_changed = False
+            return [self.bar_rect]
+        return []
 
     def handle_event(self, evt):
         if evt.type == pygame.KEYDOWN:
             if evt.key == pygame.K_LEFT:
                 self.volume = max(0.0, self.volume - 0.1)
                 pygame.mixer.music.set_volume(self.volume)
+                self.volume_changed = True
             elif evt.key == pygame.K_RIGHT:
                 self.volume = min(1.0, self.volume + 0.1)
                 pygame.mixer.music.set_volume(self.volume)
+                self.volume_changed = True
         super().handle_event(evt)
 
 class Game:
     def __init__(self):
         pygame.init()
         pygame.mixer.init()
-        click_path = os.path.join(AUDIO_DIR, 'click.wav')
-        self.click_sfx = pygame.mixer.Sound(click_path) if os.path.exists(click_path) else None
+        self.sfx = {}
+        for name, fname in SFX_FILES.items():
+            path = os.path.join(AUDIO_DIR, fname)
+            if os.path.exists(path):
+                self.sfx[name] = pygame.mixer.Sound(path)
+        self.click_sfx = self.sfx.get('click')
         if self.click_sfx:
             self.click_sfx.set_volume(0.7)
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption('Encounter FUTA')
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(EVENT_TYPES)
         self.clock = pygame.time.Clock()
+        # The bottom row is identical in every scene, so it is built once here
+        self.bottom_buttons = []
+        btn_w = SCREEN_WIDTH // len(BOTTOM_BUTTONS)
+        btn_h = 40
+        for i, label in enumerate(BOTTOM_BUTTONS):
+            rect = (i * btn_w, SCREEN_HEIGHT - btn_h, btn_w, btn_h)
+            self.bottom_buttons.append(Button(rect, label, lambda l=label: self.on_bottom(l)))
         self.scenes = {
             SCENE_SPLASH: SplashScene(self),
             SCENE_MENU: MenuScene(self)
         }
+        self._category_scenes = {}
         self.scene = None
+        self.needs_flip = True
         self.selected_school = None
         self.selected_key = None
         self.selected_difficulty = None
@@ -405,22 +529,26 @@ class Game:
 
     def change_scene(self, name):
         if name == SCENE_CATEGORY:
-            self.scenes[name] = CategoryScene(self)
+            if self.selected_key not in self._category_scenes:
+                self._category_scenes[self.selected_key] = CategoryScene(self)
+            self.scenes[name] = self._category_scenes[self.selected_key]
         elif name == SCENE_INPUT:
             self.scenes[name] = InputScene(self, self.selected_difficulty)
         elif name == SCENE_QUIZ:
             self.scenes[name] = QuizScene(self)
-        elif name == SCENE_CREDITS:
-            self.scenes[name] = CreditsScene(self)
-        elif name == SCENE_SETTINGS:
-            self.scenes[name] = SettingsScene(self)
         else:
             if name not in self.scenes:
                 if name == SCENE_MENU:
                     self.scenes[name] = MenuScene(self)
                 elif name == SCENE_SPLASH:
                     self.scenes[name] = SplashScene(self)
+                elif name == SCENE_CREDITS:
+                    self.scenes[name] = CreditsScene(self)
+                elif name == SCENE_SETTINGS:
+                    self.scenes[name] = SettingsScene(self)
         self.scene = self.scenes[name]
+        self.scene.on_enter()
+        self.needs_flip = True
 
     def on_bottom(self, label):
         if label == 'Cancel':
@@ -436,15 +564,24 @@ class Game:
 
     def run(self):
         while True:
-            for evt in pygame.event.get():
+            for evt in pygame.event.get(EVENT_TYPES):
                 if evt.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
+                if evt.type == pygame.VIDEOEXPOSE:
+                    self.needs_flip = True
                 self.scene.handle_event(evt)
+            # One clock sample per frame keeps update and draw in agreement
+            now = pygame.time.get_ticks()
             if hasattr(self.scene, 'update'):
-                self.scene.update()
-            self.scene.draw(self.screen)
-            pygame.display.flip()
+                self.scene.update(now)
+            # Scenes return the rects they changed, or None to present the whole frame
+            rects = self.scene.draw(self.screen, now)
+            if rects is None or self.needs_flip:
+                pygame.display.flip()
+                self.needs_flip = False
+            elif rects:
+                pygame.display.update(rects)
             self.clock.tick(FPS)
 
 if __name__ == '__main__':